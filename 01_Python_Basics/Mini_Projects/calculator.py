@@ -25,6 +25,15 @@ def power(x, y):
     """Return x raised to the power y"""
     return x ** y
 
+# menu choice -> operation
+OPS = {
+    '1': add,
+    '2': subtract,
+    '3': multiply,
+    '4': divide,
+    '5': power,
+}
+
 def calculator():
     print("\n==============================")
     print(" 🧮  Simple Python Calculator")
@@ -44,26 +53,19 @@ def calculator():
             print("Exiting calculator. Goodbye!")
             break
 
-        if choice in ['1', '2', '3', '4', '5']:
-            try:
-                num1 = float(input("Enter first number: "))
-                num2 = float(input("Enter second number: "))
-            except ValueError:
-                print("⚠️  Invalid input. Please enter numbers only.")
-                continue
-
-            if choice == '1':
-                print(f"Result: {add(num1, num2)}")
-            elif choice == '2':
-                print(f"Result: {subtract(num1, num2)}")
-            elif choice == '3':
-                print(f"Result: {multiply(num1, num2)}")
-            elif choice == '4':
-                print(f"Result: {divide(num1, num2)}")
-            elif choice == '5':
-                print(f"Result: {power(num1, num2)}")
-        else:
+        if choice not in OPS:
             print("⚠️ Invalid choice, please select from 1–6.")
+            continue
+
+        try:
+            num1 = float(input("Enter first number: "))
+            num2 = float(input("Enter second number: "))
+        except ValueError:
+            print("⚠️  Invalid input. Please enter numbers only.")
+            continue
+
+        result = OPS[choice](num1, num2)
+        print(f"Result: {result}")
 
 if __name__ == "__main__":
     calculator()
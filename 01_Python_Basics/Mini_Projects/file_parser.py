@@ -17,32 +17,101 @@ Usage as module:
     for rec in parser.parse("data.csv"): ...
     
 CLI:
-    python file_parser.py path/to/file --format csv
+    python file_parser_cli.py path/to/file --format csv
+
+Optional speedup: the module is fully annotated and can be compiled with
+mypyc (pip install mypy), which builds a file_parser.*.so that is imported
+in place of this file:
+    python -m mypyc file_parser.py
 """
 
 import csv
 import json
 import xml.etree.ElementTree as ET
 from configparser import ConfigParser
-from typing import Generator, Dict, List, Optional, Union, Iterable
+from typing import Any, Callable, Deque, Generator, Dict, Iterator, List, Optional, Sequence, Union, Iterable
 import os
-import sys
-import argparse
 import io
+import sys
+import codecs
+import mmap
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice, repeat
+
+try:
+    # orjson is a much faster drop-in for loads(); fall back to stdlib json
+    import orjson as _json
+except ImportError:
+    _json = json  # type: ignore[misc]
+
+try:
+    # simdjson On-Demand parsing only materializes the values that are accessed
+    import simdjson  # type: ignore
+except ImportError:
+    simdjson = None  # type: ignore
+
+try:
+    # Arrow's CSV reader returns columnar RecordBatches for parse_columnar()
+    import pyarrow as pa  # type: ignore
+    import pyarrow.csv as pa_csv  # type: ignore
+except ImportError:
+    pa = None
+    pa_csv = None
+
+try:
+    # libxml2-backed iterparse is faster than ElementTree and streams records
+    from lxml import etree as lxml_etree  # type: ignore
+except ImportError:
+    lxml_etree = None
 
 # ---------- helpers ----------
-def _open_file(path: str, encoding: Optional[str] = None):
-    """Open file with guessed encoding fallback to utf-8."""
-    if encoding:
-        return open(path, "r", encoding=encoding)
-    # try utf-8, then latin-1
+def _open_file(path: str) -> io.BufferedReader:
+    """Open file in binary mode; decoding is left to the individual parsers."""
+    return open(path, "rb")
+
+def _peek(f: Any, size: int) -> Optional[bytes]:
+    """Return up to size leading bytes of a binary handle without consuming them."""
+    if hasattr(f, "peek"):
+        return f.peek(size)[:size]
+    if f.seekable():
+        pos = f.tell()
+        head = f.read(size)
+        f.seek(pos)
+        return head
+    return None
+
+def _sniff_encoding(f: Any, size: int = 4096) -> str:
+    """Guess the encoding from a BOM or UTF-8 validity of the first bytes, else latin-1."""
+    head = _peek(f, size)
+    if head is None:
+        return "utf-8"
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
     try:
-        return open(path, "r", encoding="utf-8")
+        # final=False: a multi-byte char cut at the sniff boundary is not an error
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        return "utf-8"
     except UnicodeDecodeError:
-        return open(path, "r", encoding="latin-1")
+        return "latin-1"
+
+def _mmap_file(f: io.BufferedReader) -> Optional[mmap.mmap]:
+    """Map an open file read-only; None for empty or unmappable files."""
+    try:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        return None
 
 def _guess_format(path: str) -> str:
-    ext = os.path.splitext(path)[1].lower()
+    return _format_for_ext(os.path.splitext(path)[1])
+
+@lru_cache(maxsize=1024)
+def _format_for_ext(ext: str) -> str:
+    # cached per extension: batch jobs see the same few extensions over and over
+    ext = ext.lower()
     if ext in (".csv",):
         return "csv"
     if ext in (".tsv", ".tab"):
@@ -59,120 +128,584 @@ def _guess_format(path: str) -> str:
         return "text"
     return "unknown"
 
+def _as_records(items: List) -> List[Dict]:
+    """Wrap non-dict items as {"value": item}; the list is returned as-is if all are dicts."""
+    # map(isinstance, ...) checks every item without running Python bytecode per item
+    if all(map(isinstance, items, repeat(dict))):
+        return items
+    return [item if isinstance(item, dict) else {"value": item} for item in items]
+
+# integers of 19+ digits may not fit in 64 bits, and orjson returns those as floats
+# instead of failing. Mapping digits to "0" and all else to " " turns the check for
+# such a run into a substring search, both C-level passes over the input.
+_DIGIT_MASK = bytes(48 if 48 <= c <= 57 else 32 for c in range(256))
+_LONG_DIGITS = b"0" * 19
+
+def _has_long_int(data: Any) -> bool:
+    raw = data.encode("utf-8", "replace") if isinstance(data, str) else bytes(data)
+    return _LONG_DIGITS in raw.translate(_DIGIT_MASK)
+
+def _loads(data: Any) -> Any:
+    """
+    Decode JSON with orjson when installed, else stdlib json. Input orjson rejects
+    (NaN, Infinity) or would turn into floats (integers past 64 bits) is decoded by
+    stdlib json instead, so results never differ from json.loads().
+    """
+    if _json is not json:
+        if not _has_long_int(data):
+            try:
+                return _json.loads(data)
+            except json.JSONDecodeError:
+                pass
+    # stdlib json.loads() takes str or bytes, not a memoryview
+    return json.loads(data if isinstance(data, (str, bytes)) else bytes(data))
+
+# candidate delimiters for files of unknown format, and how much text to sample
+_DELIMITERS = (",", "\t", ";", "|")
+_SNIFF_CHARS = 1 << 16
+
+def _sniff_delimiter(lines: List[str]) -> Optional[str]:
+    """
+    Pick the delimiter that occurs the same, non-zero number of times on every
+    sampled line, the most frequent one if several do. None when no candidate is
+    consistent or there are fewer than two lines.
+    """
+    lines = [line for line in lines if line.strip()]
+    if len(lines) < 2:
+        return None
+    best, best_count = None, 0
+    for delim in _DELIMITERS:
+        # str.count is a C-level scan per line and candidate
+        counts = {line.count(delim) for line in lines}
+        if len(counts) != 1:
+            continue
+        n = counts.pop()
+        if n > best_count:
+            best, best_count = delim, n
+    return best
+
+def _ragged_record(header: List[str], row: List[str]) -> Dict:
+    """Build a record the way csv.DictReader does for a row of the wrong length."""
+    rec: Dict[Any, Any] = dict(zip(header, row))
+    if len(row) > len(header):
+        # extra fields go under the None key, like DictReader's restkey
+        rec[None] = row[len(header):]
+    else:
+        for key in header[len(row):]:
+            rec[key] = None
+    return rec
+
+def _csv_columns(header: List[str], reader: Iterator[List[str]],
+                 batch_rows: int = 10000) -> Dict[str, List]:
+    """Transpose CSV rows into one list per column, a batch of rows at a time."""
+    n = len(header)
+    cols: List[List[Any]] = [[] for _ in header]
+    while True:
+        block = list(islice(reader, batch_rows))
+        if not block:
+            break
+        # skip blank lines like the row parser does
+        rows: List[List[Any]] = [row for row in block if row]
+        if set(map(len, rows)) - {n}:
+            # ragged rows: drop extra fields, fill missing ones with None
+            rows = [row[:n] + [None] * (n - len(row)) for row in rows]
+        for col, values in zip(cols, zip(*rows)):
+            col.extend(values)
+    return dict(zip(header, cols))
+
+def _scan_ini(text: str) -> Optional[List[Dict]]:
+    """
+    Fast path for simple INI files: [section] headers, key = value / key: value
+    pairs and full-line # or ; comments, with ConfigParser's results (keys
+    lowercased, values stripped). Returns None when the file needs ConfigParser
+    itself: % interpolation, a DEFAULT section, continuation lines, duplicates,
+    a '[' line that is not a plain [section] header, or anything it would reject.
+    """
+    if "%" in text:
+        return None
+    records: List[Dict] = []
+    seen = set()
+    current: Optional[Dict] = None
+    for line in text.split("\n"):
+        s = line.strip()
+        if not s or s[0] in "#;":
+            continue
+        if line[0].isspace():
+            # indented lines may continue a multi-line value
+            return None
+        if s[0] == "[":
+            if s[-1] != "]":
+                # ConfigParser reads "[t] x = 2" as section "t"; leave such lines to it
+                return None
+            section = s[1:-1]
+            if not section or section == "DEFAULT" or section in seen:
+                return None
+            seen.add(section)
+            current = {"__section__": section}
+            records.append(current)
+            continue
+        # the option ends at the first '=' or ':', whichever comes first
+        key, sep, value = s.partition("=")
+        if ":" in key:
+            key, sep, value = s.partition(":")
+        key = key.rstrip().lower()
+        if current is None or not sep or not key or key in current:
+            return None
+        current[key] = value.strip()
+    return records
+
+@lru_cache(maxsize=64)
+def _compile_fixed(schema: tuple) -> Callable[[str, int], Dict]:
+    """
+    Generate a record builder specialized to one fixed-width schema, with the
+    slice offsets as literals: {name: line[0:20].strip(), ..., "_line_no": n}.
+    Field names are bound as globals of the generated code, never inlined as source.
+    The trailing newline needs no rstrip and short lines no padding: strip()
+    removes the newline and slices past the end are empty.
+    """
+    ns: Dict[str, Any] = {}
+    fields = []
+    pos = 0
+    for i, (name, width) in enumerate(schema):
+        ns[f"_k{i}"] = name
+        end = pos + int(width)
+        fields.append(f"_k{i}: line[{pos}:{end}].strip(), ")
+        pos = end
+    src = f"def build(line, line_no):\n    return {{{''.join(fields)}'_line_no': line_no}}\n"
+    exec(src, ns)
+    return ns["build"]
+
+# readlines() size hint for one NDJSON batch: one C-level call per ~1 MB
+_NDJSON_BATCH_BYTES = 1 << 20
+# decoding holds the GIL, so worker threads only pay off on a free-threaded build
+_FREE_THREADED = not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+def _raw_record(line: Union[str, bytes]) -> Dict:
+    # fallback for undecodable lines: return the raw line
+    if isinstance(line, bytes):
+        line = line.decode("utf-8", "replace")
+    return {"raw": line}
+
+def _simd_export(value: Any) -> Any:
+    # simdjson returns containers as proxies; copy those into plain dicts/lists
+    if isinstance(value, simdjson.Object):
+        return value.as_dict()
+    if isinstance(value, simdjson.Array):
+        return value.as_list()
+    return value
+
+def _simd_project(obj: Any, fields: Sequence[str]) -> Dict:
+    """Materialize only the requested keys of a simdjson Object."""
+    return {k: _simd_export(obj[k]) for k in fields if k in obj}
+
+def _simd_line(parser: Any, line: Union[str, bytes], fields: Sequence[str]) -> Dict:
+    # separate function so the document proxy is gone before the parser is reused
+    doc = parser.parse(line)
+    if isinstance(doc, simdjson.Object):
+        return _simd_project(doc, fields)
+    return {"value": _simd_export(doc)}
+
+def _decode_ndjson_batch(lines: Sequence[Union[str, bytes]],
+                         fields: Optional[Sequence[str]] = None) -> List[Dict]:
+    """
+    Decode a batch of NDJSON lines, skipping blanks and keeping bad lines raw.
+    With fields, objects keep only those keys; simdjson then skips the rest unparsed.
+    """
+    out = []
+    # one parser per batch: parsers are not shared between worker threads
+    parser = simdjson.Parser() if fields is not None and simdjson is not None else None
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if parser is not None and fields is not None:
+            try:
+                out.append(_simd_line(parser, line, fields))
+                continue
+            except (ValueError, RuntimeError):
+                # simdjson rejects some valid lines (NaN, integers past 64 bits)
+                pass
+        try:
+            obj = _loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            out.append(_raw_record(line))
+            continue
+        if fields is not None and isinstance(obj, dict):
+            obj = {k: obj[k] for k in fields if k in obj}
+        out.append(obj)
+    return _as_records(out)
+
+# parsers that read raw UTF-8 bytes; the rest get a text wrapper
+_BYTES_FORMATS = frozenset({"json", "ndjson", "jsonl", "xml"})
+# csv module wants newline="" so quoted fields keep their line breaks
+_CSV_FORMATS = frozenset({"csv", "tsv"})
+# formats whose parsers can build columns directly (columnar=True)
+_COLUMNAR_FORMATS = frozenset({"csv", "tsv", "fixed"})
+# parsers that take the whole file as one buffer; these read a mmap instead of read()
+_MMAP_FORMATS = {"xml"}
+if simdjson is not None or _json is not json:
+    # stdlib json.loads() cannot read from a buffer
+    _MMAP_FORMATS.add("json")
+
 # ---------- core parser ----------
 class FileParser:
-    def __init__(self, encoding: Optional[str] = None):
+    def __init__(self, encoding: Optional[str] = None) -> None:
         """
         encoding: optional override (e.g., 'utf-8' or 'latin-1')
         """
         self.encoding = encoding
+        # built once so parse() does not rebuild it (and rebind methods) per call
+        self._parser_map = {
+            "csv": self._parse_csv,
+            "tsv": self._parse_tsv,
+            "json": self._parse_json,
+            "ndjson": self._parse_ndjson,
+            "jsonl": self._parse_ndjson,
+            "xml": self._parse_xml,
+            "ini": self._parse_ini,
+            "text": self._parse_text,
+            "log": self._parse_text,
+            "fixed": self._parse_fixed_width,
+            "unknown": self._parse_unknown,
+        }
 
     def parse(self,
-              path: Union[str, io.TextIOBase],
+              path: Union[str, io.IOBase],
               fmt: Optional[str] = None,
               *,
               csv_delimiter: Optional[str] = None,
               fixed_schema: Optional[List[tuple]] = None,
-              stream: bool = True) -> Union[List[Dict], Generator[Dict, None, None]]:
+              lazy: bool = False,
+              raw_tuples: bool = False,
+              workers: int = 1,
+              fields: Optional[Iterable[str]] = None,
+              columnar: bool = False,
+              stream: bool = True) -> Union[List[Any], Iterator[Any], Dict[str, List]]:
         """
         Parse a file and yield records as dicts.
         
         Parameters:
-        - path: path to file or a file-like object.
+        - path: path to file or a file-like object (binary or text).
         - fmt: one of 'csv', 'tsv', 'json', 'ndjson', 'xml', 'ini', 'text', 'fixed' or None (auto).
-        - csv_delimiter: override delimiter (if provided).
+        - csv_delimiter: override delimiter (if provided); otherwise ',' for CSV
+          and tab for TSV. A file whose format is neither given nor known from its
+          extension is read as CSV if ',', tab, ';' or '|' occurs consistently in
+          its first 64 KB, else as plain lines.
         - fixed_schema: required for fixed-width parsing: list of (name, width) tuples.
+        - lazy: for JSON with simdjson installed, yield lazy proxy objects instead of
+          dicts, so only the keys actually read get materialized.
+        - raw_tuples: for CSV/TSV, yield (header, row) tuples instead of dicts.
+        - workers: for NDJSON, number of threads decoding line batches (0 = one per CPU).
+          Only used on a free-threaded (no-GIL) interpreter; elsewhere threads contend
+          for the GIL and are slower, so batches are decoded in the calling thread.
+        - fields: for JSON/NDJSON, keep only these keys of each object; with simdjson
+          installed the other values are never converted to Python objects.
+        - columnar: for CSV/TSV/fixed, return one {column: list of values} dict
+          instead of a dict per row. Short CSV rows get None for missing fields, as
+          in row mode; extra fields have no column and are dropped.
         - stream: if True returns generator for memory efficiency; if False returns list.
 
         Returns:
-        - generator or list of dicts
+        - generator or list of dicts, or a dict of columns when columnar=True
         """
-        # determine format
-        if fmt is None:
-            fmt = _guess_format(path if isinstance(path, str) else getattr(path, "name", ""))
-        fmt = fmt.lower()
-
-        parser_map = {
-            "csv": self._parse_csv,
-            "tsv": self._parse_tsv,
-            "json": self._parse_json,
-            "ndjson": self._parse_ndjson,
-            "jsonl": self._parse_ndjson,
-            "xml": self._parse_xml,
-            "ini": self._parse_ini,
-            "text": self._parse_text,
-            "log": self._parse_text,
-            "fixed": self._parse_fixed_width,
-            "unknown": self._parse_unknown,
-        }
+        # determine format (guessed names are already lowercase)
+        if fmt is not None:
+            fmt = fmt.lower()
+        elif isinstance(path, str):
+            fmt = _guess_format(path)
+        else:
+            fmt = _guess_format(getattr(path, "name", ""))
 
-        if fmt not in parser_map:
+        parser = self._parser_map.get(fmt)
+        if parser is None:
             raise ValueError(f"Unsupported format: {fmt}")
+        if columnar and fmt not in _COLUMNAR_FORMATS:
+            raise ValueError(f"Columnar output is not supported for format: {fmt}")
 
-        parser = parser_map[fmt]
-
+        src: Any
         if isinstance(path, str):
-            f = _open_file(path, encoding=self.encoding)
-            close_after = True
+            src = _open_file(path)
+            own = True
+        else:
+            src = path
+            own = False
+
+        records = self._records(parser, src, own, fmt,
+                                csv_delimiter=csv_delimiter,
+                                fixed_schema=fixed_schema,
+                                lazy=lazy,
+                                raw_tuples=raw_tuples,
+                                workers=workers,
+                                fields=tuple(fields) if fields is not None else None,
+                                columnar=columnar)
+        if columnar:
+            # columnar parsers yield exactly one table; unpacking also closes the file
+            (table,) = records
+            return table
+        if stream:
+            return records
         else:
-            f = path
-            close_after = False
+            return list(records)
 
+    def _records(self, parser: Callable[..., Iterator[Any]], src: Any, own: bool, fmt: str,
+                 **kwargs: Any) -> Iterator[Any]:
+        # runs inside the generator so the file stays open until iteration ends
+        f = self._decoded(src, fmt)
+        if own and f is src and fmt in _MMAP_FORMATS:
+            f = _mmap_file(src) or src
         try:
-            gen = parser(f,
-                         csv_delimiter=csv_delimiter,
-                         fixed_schema=fixed_schema)
-            if stream:
-                return gen
-            else:
-                return list(gen)
+            yield from parser(f, **kwargs)
         finally:
-            if close_after:
+            if isinstance(f, mmap.mmap):
                 f.close()
+                src.close()
+            elif f is not src:
+                # never close a caller's handle through our wrapper
+                if own:
+                    f.close()
+                else:
+                    f.detach()
+            elif own:
+                src.close()
+
+    def _decoded(self, src: Any, fmt: str) -> Any:
+        """
+        Return the handle that fmt's parser reads: binary for UTF-8 JSON/XML and for
+        any XML when no encoding is forced, else text.
+        """
+        if not isinstance(src, (io.BufferedIOBase, io.RawIOBase)):
+            # already a text handle
+            return src
+        if fmt == "xml" and self.encoding is None:
+            # lxml and expat honour the document's encoding declaration; a sniffed
+            # guess (latin-1 for anything not UTF-8) would override it
+            return src
+        encoding = self.encoding or _sniff_encoding(src)
+        if fmt in _BYTES_FORMATS and codecs.lookup(encoding).name == "utf-8":
+            return src
+        return io.TextIOWrapper(src, encoding=encoding,
+                                newline="" if fmt in _CSV_FORMATS else None)
+
+    def parse_columnar(self,
+                       path: Union[str, io.IOBase],
+                       fmt: str = "csv",
+                       *,
+                       csv_delimiter: Optional[str] = None,
+                       block_size: int = 1 << 20,
+                       rows: bool = False) -> Generator:
+        """
+        Parse a CSV/TSV file in batches instead of one dict per row.
+
+        Parameters:
+        - path: path to file or a binary file-like object.
+        - fmt: 'csv' or 'tsv'.
+        - csv_delimiter: override delimiter (if provided).
+        - block_size: bytes read per batch by the Arrow reader.
+        - rows: if True each batch is converted to a list of dicts.
+
+        Yields:
+        - rows=False: pyarrow.RecordBatch objects when pyarrow is installed,
+          otherwise {column: list of values} dicts built by the regular CSV parser.
+        - rows=True: lists of dicts, the same records parse() would yield.
+        Values are always strings, as with parse(); empty fields stay "".
+        File-like objects must be seekable when pyarrow is used.
+
+        Raises:
+        - pyarrow.ArrowInvalid (pyarrow only) on a row whose field count differs
+          from the header; parse() and the fallback fill such rows like csv.DictReader.
+        """
+        fmt = fmt.lower()
+        if fmt not in ("csv", "tsv"):
+            raise ValueError(f"Unsupported columnar format: {fmt}")
+        delim = csv_delimiter if csv_delimiter is not None else ("\t" if fmt == "tsv" else ",")
+
+        if pa_csv is None:
+            yield from self._parse_csv_batches(path, delim, rows)
+            return
+
+        if isinstance(path, str):
+            if os.path.getsize(path) == 0:
+                return
+            encoding = self.encoding
+            if encoding is None:
+                with _open_file(path) as f:
+                    encoding = _sniff_encoding(f)
+        else:
+            if not _peek(path, 1):
+                return
+            encoding = self.encoding or _sniff_encoding(path)
+        read_options = pa_csv.ReadOptions(block_size=block_size, encoding=encoding)
+        # quoted fields may hold newlines, and such a field can straddle a block boundary
+        parse_options = pa_csv.ParseOptions(delimiter=delim, newlines_in_values=True)
+
+        # a first open only reads the header block; every column is then read as
+        # a non-null string so values match parse() instead of Arrow's inferred types
+        start = 0 if isinstance(path, str) else path.tell()
+        names = pa_csv.open_csv(path, read_options=read_options,
+                                parse_options=parse_options).schema.names
+        if not isinstance(path, str):
+            path.seek(start)
+        convert_options = pa_csv.ConvertOptions(column_types={name: pa.string() for name in names},
+                                                strings_can_be_null=False,
+                                                quoted_strings_can_be_null=False)
+        reader = pa_csv.open_csv(path,
+                                 read_options=read_options,
+                                 parse_options=parse_options,
+                                 convert_options=convert_options)
+        for batch in reader:
+            yield batch.to_pylist() if rows else batch
+
+    def _parse_csv_batches(self, path: Union[str, io.IOBase], delim: str, rows: bool,
+                           batch_rows: int = 10000) -> Iterator[Any]:
+        # fallback for parse_columnar() when pyarrow is not importable
+        src: Any
+        if isinstance(path, str):
+            src, own = _open_file(path), True
+        else:
+            src, own = path, False
+        gen = self._records(self._parse_csv, src, own, "csv",
+                            csv_delimiter=delim, raw_tuples=not rows)
+        while True:
+            batch = list(islice(gen, batch_rows))
+            if not batch:
+                break
+            if rows:
+                yield batch
+            else:
+                # (header, row) tuples transposed into one list per column
+                yield _csv_columns(batch[0][0], (row for _, row in batch))
 
     # ---------- parsers ----------
-    def _parse_csv(self, f: io.TextIOBase, *, csv_delimiter: Optional[str]=None, **_):
-        delim = csv_delimiter if csv_delimiter is not None else ","
-        reader = csv.DictReader(f, delimiter=delim)
+    def _parse_csv(self, f: Iterable[str], *, csv_delimiter: Optional[str]=None,
+                   default_delimiter: str = ",", raw_tuples: bool = False,
+                   columnar: bool = False, **_) -> Iterator[Any]:
+        delim = csv_delimiter if csv_delimiter is not None else default_delimiter
+        reader = csv.reader(f, delimiter=delim)
+        header = next(reader, None)
+        if columnar:
+            yield _csv_columns(header or [], reader)
+            return
+        if header is None:
+            return
+        if raw_tuples:
+            for row in reader:
+                if row:
+                    yield (header, row)
+            return
+        n = len(header)
         for row in reader:
-            yield {k: v for k, v in row.items()}
+            # skip blank lines like DictReader does
+            if not row:
+                continue
+            if len(row) == n:
+                yield dict(zip(header, row))
+            else:
+                yield _ragged_record(header, row)
 
-    def _parse_tsv(self, f: io.TextIOBase, **_):
-        reader = csv.DictReader(f, delimiter="\t")
-        for row in reader:
-            yield {k: v for k, v in row.items()}
+    def _parse_tsv(self, f: io.TextIOBase, **kwargs: Any) -> Iterator[Any]:
+        kwargs["default_delimiter"] = "\t"
+        return self._parse_csv(f, **kwargs)
+
+    def _parse_json(self, f: Any, *, lazy: bool = False,
+                    fields: Optional[Sequence[str]] = None, **_) -> Iterator[Any]:
+        if isinstance(f, mmap.mmap):
+            # decode straight from the mapped pages, no read() copy
+            with memoryview(f) as buf:
+                yield from self._parse_json_buf(buf, lazy, fields)
+        else:
+            yield from self._parse_json_buf(f.read(), lazy, fields)
 
-    def _parse_json(self, f: io.TextIOBase, **_):
+    def _parse_json_buf(self, buf: Any, lazy: bool,
+                        fields: Optional[Sequence[str]] = None) -> Iterator[Any]:
+        if simdjson is not None:
+            try:
+                # a fresh parser per document: simdjson invalidates proxies on re-parse
+                doc = simdjson.Parser().parse(buf)
+            except (ValueError, RuntimeError):
+                # simdjson rejects some valid input (NaN, integers past 64 bits)
+                pass
+            else:
+                yield from self._parse_json_simd(doc, lazy, fields)
+                return
         # Load whole JSON (expecting list or dict)
-        data = json.load(f)
+        data = _loads(buf)
+        if fields is not None:
+            if isinstance(data, list):
+                data = [{k: item[k] for k in fields if k in item} if isinstance(item, dict) else item
+                        for item in data]
+            elif isinstance(data, dict):
+                data = {k: data[k] for k in fields if k in data}
         if isinstance(data, list):
-            for item in data:
-                yield item if isinstance(item, dict) else {"value": item}
+            yield from _as_records(data)
         elif isinstance(data, dict):
             # yield the dict as single record
             yield data
         else:
             yield {"value": data}
 
-    def _parse_ndjson(self, f: io.TextIOBase, **_):
-        for line in f:
-            line = line.strip()
-            if not line:
+    def _parse_json_simd(self, doc: Any, lazy: bool,
+                         fields: Optional[Sequence[str]] = None) -> Iterator[Any]:
+        if isinstance(doc, simdjson.Array):
+            for item in doc:
+                if isinstance(item, simdjson.Object):
+                    if fields is not None:
+                        yield _simd_project(item, fields)
+                    else:
+                        yield item if lazy else item.as_dict()
+                elif isinstance(item, simdjson.Array):
+                    yield {"value": item.as_list()}
+                else:
+                    yield {"value": item}
+        elif isinstance(doc, simdjson.Object):
+            if fields is not None:
+                yield _simd_project(doc, fields)
+            else:
+                yield doc if lazy else doc.as_dict()
+        else:
+            yield {"value": doc}
+
+    def _parse_ndjson(self, f: io.IOBase, *, workers: int = 1,
+                      fields: Optional[Sequence[str]] = None, **_) -> Iterator[Dict]:
+        batches = iter(lambda: f.readlines(_NDJSON_BATCH_BYTES), [])
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or not _FREE_THREADED:
+            for batch in batches:
+                yield from _decode_ndjson_batch(batch, fields)
+            return
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # bound the batches in flight so large files are not read up front
+            pending: Deque[Any] = deque()
+            for batch in batches:
+                pending.append(pool.submit(_decode_ndjson_batch, batch, fields))
+                if len(pending) >= workers * 2:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    def _parse_xml(self, f: io.IOBase, **_) -> Iterator[Dict]:
+        # This is a simple XML->dict converter: yields direct child elements of root.
+        # Elements are parsed incrementally and dropped once converted, so memory
+        # stays at one record rather than the whole document.
+        if lxml_etree is not None and isinstance(f, (io.BufferedIOBase, io.RawIOBase, mmap.mmap)):
+            # lxml reads bytes and honours the document's declared encoding
+            events = lxml_etree.iterparse(f, events=("start", "end"),
+                                          remove_comments=True, remove_pis=True)
+        else:
+            # text handles (a non-UTF-8 encoding or a caller's own handle) are already
+            # decoded; lxml only takes bytes, so let ElementTree read the text
+            events = ET.iterparse(f, events=("start", "end"))
+        root: Any = None
+        depth = 0
+        for event, child in events:
+            if event == "start":
+                depth += 1
+                if depth == 1:
+                    root = child
                 continue
-            try:
-                obj = json.loads(line)
-                yield obj if isinstance(obj, dict) else {"value": obj}
-            except json.JSONDecodeError:
-                # fallback: return raw line
-                yield {"raw": line}
-
-    def _parse_xml(self, f: io.TextIOBase, **_):
-        # This is a simple XML->dict converter: yields direct child elements of root
-        tree = ET.parse(f)
-        root = tree.getroot()
-        # if root has multiple children with same tag, yield each
-        for child in root:
-            rec = {}
+            depth -= 1
+            if depth != 1:
+                continue
+            rec: Dict[str, Any] = {}
             # include attributes
             rec.update(child.attrib)
             for sub in child:
@@ -187,11 +720,18 @@ class FileParser:
             # if text content exists and no children
             if not rec and (child.text and child.text.strip()):
                 rec = {"text": child.text.strip()}
+            # earlier siblings are already gone, so this is the first child
+            root.remove(child)
             yield rec
 
-    def _parse_ini(self, f: io.TextIOBase, **_):
+    def _parse_ini(self, f: io.TextIOBase, **_) -> Iterator[Dict]:
+        text = f.read()
+        records = _scan_ini(text)
+        if records is not None:
+            yield from records
+            return
         cfg = ConfigParser()
-        cfg.read_file(f)
+        cfg.read_string(text)
         for section in cfg.sections():
             # convert each section into a dict with section name
             record = {"__section__": section}
@@ -199,11 +739,12 @@ class FileParser:
                 record[k] = v
             yield record
 
-    def _parse_text(self, f: io.TextIOBase, **_):
+    def _parse_text(self, f: io.TextIOBase, **_) -> Iterator[Dict]:
         for i, line in enumerate(f, start=1):
             yield {"line_no": i, "text": line.rstrip("\n")}
 
-    def _parse_fixed_width(self, f: io.TextIOBase, *, fixed_schema: Optional[List[tuple]] = None, **_):
+    def _parse_fixed_width(self, f: io.TextIOBase, *, fixed_schema: Optional[List[tuple]] = None,
+                           columnar: bool = False, **_) -> Iterator[Dict]:
         """
         fixed_schema: list of tuples (field_name, width)
         e.g., [('name', 20), ('age', 3), ('city', 15)]
@@ -212,61 +753,42 @@ class FileParser:
             raise ValueError("fixed_schema is required for fixed-width parsing")
         widths = [w for (_, w) in fixed_schema]
         names = [n for (n, _) in fixed_schema]
-        total_width = sum(widths)
+        if columnar:
+            yield self._fixed_width_columns(f, names, widths)
+            return
+        build = _compile_fixed(tuple((name, width) for name, width in fixed_schema))
         for line_no, line in enumerate(f, start=1):
-            raw = line.rstrip("\n")
-            # pad if shorter
-            raw = raw.ljust(total_width)
+            yield build(line, line_no)
+
+    def _fixed_width_columns(self, f: io.TextIOBase, names: List[str], widths: List[int]) -> Dict:
+        total_width = sum(widths)
+        cols: List[List[Any]] = [[] for _ in names]
+        n_rows = 0
+        for line in f:
+            raw = line.rstrip("\n").ljust(total_width)
             pos = 0
-            rec = {}
-            for name, width in zip(names, widths):
-                chunk = raw[pos:pos+width]
-                rec[name] = chunk.strip()
+            for col, width in zip(cols, widths):
+                col.append(raw[pos:pos+width].strip())
                 pos += width
-            rec["_line_no"] = line_no
-            yield rec
+            n_rows += 1
+        table: Dict[str, List] = dict(zip(names, cols))
+        table["_line_no"] = list(range(1, n_rows + 1))
+        return table
 
-    def _parse_unknown(self, f: io.TextIOBase, **_):
+    def _parse_unknown(self, f: io.TextIOBase, **kwargs: Any) -> Iterator[Any]:
+        # sample whole lines for delimiter detection, then parse them first
+        head = f.readlines(_SNIFF_CHARS)
+        lines = chain(head, f)
+        delim = _sniff_delimiter(head)
+        if delim is not None:
+            kwargs["csv_delimiter"] = delim
+            yield from self._parse_csv(lines, **kwargs)
+            return
         # fallback: yield lines
-        for i, line in enumerate(f, start=1):
+        for i, line in enumerate(lines, start=1):
             yield {"line_no": i, "text": line.rstrip("\n")}
 
-# ---------- CLI ----------
-def main(argv: Optional[Iterable[str]] = None):
-    p = argparse.ArgumentParser(description="Simple file parser utility")
-    p.add_argument("path", help="Path to input file")
-    p.add_argument("--format", "-f", help="Format override (csv, tsv, json, ndjson, xml, ini, text, fixed)")
-    p.add_argument("--encoding", "-e", help="File encoding (utf-8, latin-1, etc.)")
-    p.add_argument("--no-stream", dest="stream", action="store_false", help="Return list instead of streaming (print all)")
-    p.add_argument("--fixed-schema", help="For fixed format: comma-separated name:width pairs, e.g. name:20,age:3")
-    p.add_argument("--delimiter", "-d", help="CSV/TSV delimiter override")
-    args = p.parse_args(list(argv) if argv is not None else None)
-
-    fp = FileParser(encoding=args.encoding)
-    fixed_schema = None
-    if args.fixed_schema:
-        parts = args.fixed_schema.split(",")
-        schema = []
-        for part in parts:
-            if ":" not in part:
-                print("Invalid fixed-schema format, expected name:width", file=sys.stderr)
-                return 2
-            name, width = part.split(":", 1)
-            schema.append((name.strip(), int(width.strip())))
-        fixed_schema = schema
-
-    gen_or_list = fp.parse(args.path,
-                           fmt=args.format,
-                           csv_delimiter=args.delimiter,
-                           fixed_schema=fixed_schema,
-                           stream=args.stream)
-    if args.stream:
-        for rec in gen_or_list:
-            print(json.dumps(rec, ensure_ascii=False))
-    else:
-        # print pretty
-        import pprint
-        pprint.pprint(gen_or_list)
-
 if __name__ == "__main__":
+    # the CLI lives in an uncompiled module so this one can be built with mypyc
+    from file_parser_cli import main
     main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+file_parser_cli.py
+
+Command-line entry point for file_parser. Kept separate so file_parser.py
+can be compiled with mypyc while this script stays plain Python.
+
+Usage:
+    python file_parser_cli.py path/to/file --format csv
+"""
+
+import argparse
+import json
+import sys
+from typing import Iterable, Optional
+
+from file_parser import FileParser
+
+def main(argv: Optional[Iterable[str]] = None):
+    p = argparse.ArgumentParser(description="Simple file parser utility")
+    p.add_argument("path", help="Path to input file")
+    p.add_argument("--format", "-f", help="Format override (csv, tsv, json, ndjson, xml, ini, text, fixed)")
+    p.add_argument("--encoding", "-e", help="File encoding (utf-8, latin-1, etc.)")
+    p.add_argument("--no-stream", dest="stream", action="store_false", help="Return list instead of streaming (print all)")
+    p.add_argument("--fixed-schema", help="For fixed format: comma-separated name:width pairs, e.g. name:20,age:3")
+    p.add_argument("--delimiter", "-d", help="CSV/TSV delimiter override")
+    args = p.parse_args(list(argv) if argv is not None else None)
+
+    fp = FileParser(encoding=args.encoding)
+    fixed_schema = None
+    if args.fixed_schema:
+        parts = args.fixed_schema.split(",")
+        schema = []
+        for part in parts:
+            if ":" not in part:
+                print("Invalid fixed-schema format, expected name:width", file=sys.stderr)
+                return 2
+            name, width = part.split(":", 1)
+            schema.append((name.strip(), int(width.strip())))
+        fixed_schema = schema
+
+    gen_or_list = fp.parse(args.path,
+                           fmt=args.format,
+                           csv_delimiter=args.delimiter,
+                           fixed_schema=fixed_schema,
+                           stream=args.stream)
+    if args.stream:
+        for rec in gen_or_list:
+            print(json.dumps(rec, ensure_ascii=False))
+    else:
+        # print pretty
+        import pprint
+        pprint.pprint(gen_or_list)
+
+if __name__ == "__main__":
+    main()